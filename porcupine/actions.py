@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import sys
+from collections.abc import Sequence
 from dataclasses import dataclass
 from functools import partial
 from pathlib import Path
@@ -8,10 +10,13 @@ from typing import Callable, Union
 from porcupine.tabs import FileTab
 
 
+# Manual __slots__, because dataclass(slots=True) needs Python 3.10
 @dataclass(frozen=True)
 class BareAction:
     """Action that requires no context in the callback"""
 
+    __slots__ = ("name", "description", "callback", "availability_callback")
+
     name: str
     description: str
     callback: Callable[[], None]
@@ -22,6 +27,8 @@ class BareAction:
 class FileTabAction:
     """Action that requires a FileTab to be provided to the callback"""
 
+    __slots__ = ("name", "description", "callback", "availability_callback")
+
     name: str
     description: str
     callback: Callable[[FileTab], None]
@@ -32,6 +39,8 @@ class FileTabAction:
 class PathAction:
     """Action that requires a Path to be provided to the callback"""
 
+    __slots__ = ("name", "description", "callback", "availability_callback")
+
     name: str
     description: str
     callback: Callable[[Path], None]
@@ -50,15 +59,17 @@ def register_bare_action(
     callback: Callable[..., None],
     availability_callback: Callable[[], bool] = lambda: True,
 ) -> BareAction:
-    if name in _actions:
-        raise ValueError(f"Action with the name {name!r} already exists")
+    # Interning makes the dict lookups that use the name as a key cheaper.
+    name = sys.intern(name)
     action = BareAction(
         name=name,
         description=description,
         callback=callback,
         availability_callback=availability_callback,
     )
-    _actions[name] = action
+    # setdefault does the duplicate check and the insert with one dict lookup
+    if _actions.setdefault(name, action) is not action:
+        raise ValueError(f"Action with the name {name!r} already exists")
     return action
 
 
@@ -69,15 +80,15 @@ def register_filetab_action(
     callback: Callable[[FileTab], None],
     availability_callback: Callable[[FileTab], bool] = lambda tab: True,
 ) -> FileTabAction:
-    if name in _actions:
-        raise ValueError(f"Action with the name {name!r} already exists")
+    name = sys.intern(name)
     action = FileTabAction(
         name=name,
         description=description,
         callback=callback,
         availability_callback=availability_callback,
     )
-    _actions[name] = action
+    if _actions.setdefault(name, action) is not action:
+        raise ValueError(f"Action with the name {name!r} already exists")
     return action
 
 
@@ -88,15 +99,15 @@ def register_path_action(
     callback: Callable[[Path], None],
     availability_callback: Callable[[Path], bool] = lambda path: True,
 ) -> PathAction:
-    if name in _actions:
-        raise ValueError(f"Action with the name {name!r} already exists")
+    name = sys.intern(name)
     action = PathAction(
         name=name,
         description=description,
         callback=callback,
         availability_callback=availability_callback,
     )
-    _actions[name] = action
+    if _actions.setdefault(name, action) is not action:
+        raise ValueError(f"Action with the name {name!r} already exists")
     return action
 
 
@@ -111,17 +122,33 @@ def get_all_actions() -> dict[str, Action]:
 # Availability Helpers
 
 
-def filetype_is(filetypes: str | list[str]) -> Callable[[FileTab], bool]:
-    def _filetype_is(filetypes: list[str], tab: FileTab) -> bool:
-        try:
-            filetype = tab.settings.get("filetype_name", object)
-        except KeyError:
-            # don't ask me why a `get` method can raise a KeyError :p
-            return False
+def _filetype_is(filetypes: frozenset[str], tab: FileTab) -> bool:
+    try:
+        filetype = tab.settings.get("filetype_name", object)
+    except KeyError:
+        # don't ask me why a `get` method can raise a KeyError :p
+        return False
+
+    return filetype in filetypes
+
+
+_filetype_is_cache: dict[tuple[str, ...], Callable[[FileTab], bool]] = {}
 
-        return filetype in filetypes
 
+def filetype_is(filetypes: str | Sequence[str]) -> Callable[[FileTab], bool]:
     if isinstance(filetypes, str):
         filetypes = [filetypes]
 
-    return partial(_filetype_is, filetypes)
+    # The filetypes are copied here, so the returned callback isn't affected
+    # if the caller's sequence is mutated later.
+    #
+    # Plugins tend to pass the same filetypes, e.g. ["Python"], so identical
+    # calls share one callback instead of each getting a new one.
+    key = tuple(filetypes)
+    callback = _filetype_is_cache.get(key)
+    if callback is None:
+        # The callback runs whenever the selected tab changes, so check
+        # membership with a set instead of scanning a list every time.
+        callback = partial(_filetype_is, frozenset(key))
+        _filetype_is_cache[key] = callback
+    return callback
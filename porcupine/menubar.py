@@ -74,13 +74,22 @@ log = logging.getLogger(__name__)
 # For some reason, binding <F4> on Windows also captures Alt+F4 presses.
 # IMO applications shouldn't receive the window manager's special key bindings.
 # Windows is weird...
-def _event_is_windows_alt_f4(event: tkinter.Event[tkinter.Misc]) -> bool:
-    return (
-        sys.platform == "win32"
-        and isinstance(event.state, int)
-        and bool(event.state & 0x20000)  # Alt key is pressed
-        and event.keysym == "F4"
-    )
+#
+# The platform check is done once at import time, because this runs for every
+# key press that triggers a menu item.
+if sys.platform == "win32":
+
+    def _event_is_windows_alt_f4(event: tkinter.Event[tkinter.Misc]) -> bool:
+        return (
+            isinstance(event.state, int)
+            and bool(event.state & 0x20000)  # Alt key is pressed
+            and event.keysym == "F4"
+        )
+
+else:
+
+    def _event_is_windows_alt_f4(event: tkinter.Event[tkinter.Misc]) -> bool:
+        return False
 
 
 # Try this:
@@ -116,12 +125,21 @@ def _generate_event(name: str, event: tkinter.Event[tkinter.Misc]) -> Literal["b
     return "break"
 
 
+# All text widgets share one callback per virtual event, instead of each
+# widget getting its own functools.partial object.
+_generate_event_callbacks: dict[str, Callable[[tkinter.Event[tkinter.Misc]], Literal["break"]]] = {}
+
+
 def _fix_text_widget_bindings(event: tkinter.Event[tkinter.Misc]) -> None:
     for virtual_event in event.widget.event_info():
         if virtual_event.startswith("<<Menubar:") and not event.widget.bind(virtual_event):
             # When the keys are pressed, generate the event on the main
             # window so the menu callback will trigger.
-            event.widget.bind(virtual_event, partial(_generate_event, virtual_event), add=True)
+            callback = _generate_event_callbacks.get(virtual_event)
+            if callback is None:
+                callback = partial(_generate_event, virtual_event)
+                _generate_event_callbacks[virtual_event] = callback
+            event.widget.bind(virtual_event, callback, add=True)
             assert event.widget.bind(virtual_event)
 
 
@@ -294,12 +312,21 @@ def update_keyboard_shortcuts() -> None:
     _update_shortcuts_for_opening_submenus()
 
 
-_menu_item_enabledness_callbacks: list[Callable[..., None]] = []
+_menu_item_enabledness_callbacks: list[Callable[[tabs.Tab | None], None]] = []
 
 
 def _refresh_menu_item_enabledness(*junk: object) -> None:
+    # This runs for every event registered with
+    # register_enabledness_check_event(), so don't do anything when no menu
+    # items actually care about their enabledness.
+    if not _menu_item_enabledness_callbacks:
+        return
+
+    # Asking the tab manager for the selected tab is a Tcl call, so do it once
+    # here instead of in each callback.
+    tab = get_tab_manager().select()
     for callback in _menu_item_enabledness_callbacks:
-        callback(*junk)
+        callback(tab)
 
 
 # TODO: create type for events
@@ -340,10 +367,11 @@ def set_enabled_based_on_tab(path: str, callback: Callable[[tabs.Tab | None], bo
     easier.
     """
 
-    def update_enabledness(*junk: object, path: str) -> None:
-        tab = get_tab_manager().select()
+    # Splitting the path doesn't depend on the selected tab, so it's done once
+    # here instead of every time the callbacks run.
+    parent, child = _split_parent(path)
 
-        parent, child = _split_parent(path)
+    def update_enabledness(tab: tabs.Tab | None) -> None:
         menu = get_menu(parent)
         index = _find_item(menu, child)
         if index is None:
@@ -353,9 +381,9 @@ def set_enabled_based_on_tab(path: str, callback: Callable[[tabs.Tab | None], bo
         else:
             menu.entryconfig(index, state="disabled")
 
-    update_enabledness(path=path)
+    update_enabledness(get_tab_manager().select())
 
-    _menu_item_enabledness_callbacks.append(partial(update_enabledness, path=path))
+    _menu_item_enabledness_callbacks.append(update_enabledness)
 
 
 def get_filetab() -> tabs.FileTab:
@@ -412,12 +440,16 @@ def add_filetab_action(path: str, action: actions.FileTabAction, **kwargs: Any)
     but if you do, they are passed to :meth:`tkinter.Menu.add_command`.
     """
 
+    # Look up the action's attributes once instead of on every menu click and
+    # every tab change.
+    action_callback = action.callback
+    availability_callback = action.availability_callback
+
     get_menu(path).add_command(
-        label=action.name, command=lambda: action.callback(get_filetab()), **kwargs
+        label=action.name, command=lambda: action_callback(get_filetab()), **kwargs
     )
     set_enabled_based_on_tab(
-        path,
-        callback=lambda tab: isinstance(tab, tabs.FileTab) and action.availability_callback(tab),
+        path, callback=lambda tab: isinstance(tab, tabs.FileTab) and availability_callback(tab)
     )
 
 